@@ -21,21 +21,7 @@ class MedicoverDbClient:
         # Row layout:
         # (id, region, city, [specialty_ids], clinic, doctor, startDate, endDate, timeRange,
         #  autobook, exclusions, type, account)
-        watch_tuple = (
-            row[0],
-            row[1],
-            row[2],
-            specialties,
-            row[4],
-            row[5],
-            row[6],
-            row[7],
-            row[8],
-            row[9],
-            row[10],
-            row[11],
-            row[12] if len(row) > 12 else None,
-        )
+        watch_tuple = (*row[:3], specialties, *row[4:12], row[12] if len(row) > 12 else None)
         return MedicoverWatch.from_tuple(watch_tuple)
 
     def get_watch(self, watch_id: int) -> Optional[MedicoverWatch]:
@@ -45,11 +31,8 @@ class MedicoverDbClient:
         return self._parse_row_to_watch(row)
 
     def get_watches(self) -> List[MedicoverWatch]:
-        res = self.db.get_watches()
-        watches = []
-        for watch in res:
-            watches.append(self._parse_row_to_watch(watch))
-        return watches
+        parse = self._parse_row_to_watch
+        return [parse(row) for row in self.db.get_watches()]
 
     def remove_watch(self, watch_id: int) -> bool:
         return self.db.remove_watch(watch_id)
@@ -1,4 +1,5 @@
 import datetime
+from functools import cached_property
 
 from src.id_value_util import IdValue
 
@@ -79,6 +80,16 @@ class Appointment:
         ap.account = data[8]
         return ap
 
+    @cached_property
+    def date_only(self) -> datetime.date:
+        """Date part of date_time, computed once per appointment."""
+        return self.date_time.date()
+
+    @cached_property
+    def date_ordinal(self) -> int:
+        """Proleptic Gregorian ordinal of date_only, for cheap date range comparisons."""
+        return self.date_only.toordinal()
+
     def __eq__(self, other) -> bool:
         return (
             self.clinic.id == other.clinic.id
@@ -3,6 +3,18 @@ import datetime
 from .appointment import Appointment
 from .watch import WatchExclusions
 
+IdFilter = int | frozenset[int] | None
+
+
+def _as_id_set(id_filter: IdFilter) -> frozenset[int] | None:
+    # A single ID is treated as a one-element set; None (or the legacy 0) means "any",
+    # while an empty set matches nothing
+    if id_filter is None:
+        return None
+    if isinstance(id_filter, int):
+        return frozenset((id_filter,)) if id_filter else None
+    return id_filter
+
 
 def is_excluded(appointment: Appointment, exclusions: WatchExclusions) -> bool:
     if not exclusions:
@@ -26,23 +38,29 @@ def match_single_appointment_to_be_canceled(
 
 def match_single_appointment(
     specialty: int,
-    clinic: int | None,
-    doctor: int | None,
+    clinic: IdFilter,
+    doctor: IdFilter,
     date_time: datetime.datetime,
     appointments: list[Appointment],
     exact_time_match: bool = True,
     exact_date_match: bool = True,
 ) -> Appointment | None:
+    clinics = _as_id_set(clinic)
+    doctors = _as_id_set(doctor)
+    match_any_date = not exact_time_match and not exact_date_match
+    date = date_time.date()
     for appointment in appointments:
+        # Cheap ID checks first, so mismatches never reach the datetime comparisons
+        if appointment.specialty.id != specialty:
+            continue
+        if clinics is not None and appointment.clinic.id not in clinics:
+            continue
+        if doctors is not None and appointment.doctor.id not in doctors:
+            continue
         if (
-            appointment.specialty.id == specialty
-            and (not clinic or appointment.clinic.id == clinic)
-            and (not doctor or appointment.doctor.id == doctor)
-            and (
-                (not exact_time_match and not exact_date_match)
-                or (exact_time_match and appointment.date_time == date_time)
-                or (exact_date_match and appointment.date_time.date() == date_time.date())
-            )
+            match_any_date
+            or (exact_time_match and appointment.date_time == date_time)
+            or (exact_date_match and appointment.date_only == date)
         ):
             return appointment
     return None
@@ -50,8 +68,8 @@ def match_single_appointment(
 
 def match_within_date_range(
     specialty: int,
-    clinic: int | None,
-    doctor: int | None,
+    clinic: IdFilter,
+    doctor: IdFilter,
     start_date: datetime.date,
     end_date: datetime.date | None,
     appointments: list[Appointment],
@@ -59,12 +77,16 @@ def match_within_date_range(
     matching = []
     if not end_date:
         end_date = datetime.date.max
+    clinics = _as_id_set(clinic)
+    doctors = _as_id_set(doctor)
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
     for appointment in appointments:
         if (
             appointment.specialty.id == specialty
-            and (not clinic or appointment.clinic.id == clinic)
-            and (not doctor or appointment.doctor.id == doctor)
-            and start_date <= appointment.date_time.date() <= end_date
+            and (clinics is None or appointment.clinic.id in clinics)
+            and (doctors is None or appointment.doctor.id in doctors)
+            and start_ordinal <= appointment.date_ordinal <= end_ordinal
         ):
             matching.append(appointment)
     return matching
@@ -3,6 +3,8 @@ from src.logger import log
 from .appointment import Appointment
 from .watch import Watch
 
+SEPARATOR = "-" * 50
+
 
 def format_entity_by_lines(entities: list[Watch] | list[Appointment]) -> list[str]:
     messages: list[str] = []
@@ -14,22 +16,28 @@ def format_entity_by_lines(entities: list[Watch] | list[Appointment]) -> list[st
 def format_message_chunks(messages: list[str]) -> list[str]:
     formatted_messages: list[str] = []
     for m in messages:
-        formatted_messages.append("-" * 50)
+        formatted_messages.append(SEPARATOR)
         for line in m.splitlines():
             formatted_messages.append(line)
-    formatted_messages.append("-" * 50)
+    formatted_messages.append(SEPARATOR)
     return formatted_messages
 
 
+def _log_entity_records(entities: list[Appointment] | list[Watch]):
+    # One log record per entity instead of per line, the logging pipeline is costly per call
+    for message in format_entity_by_lines(entities):
+        log.info(SEPARATOR)
+        log.info(message)
+    log.info(SEPARATOR)
+
+
 def log_entities_with_info(appointments: list[Appointment] | None):
     if not appointments:
         return
     else:
         log.info("Items found:")
-        for line in format_message_chunks(format_entity_by_lines(appointments)):
-            log.info(line)
+        _log_entity_records(appointments)
 
 
 def log_entities(entities: list[Appointment] | list[Watch]):
-    for line in format_message_chunks(format_entity_by_lines(entities)):
-        log.info(line)
+    _log_entity_records(entities)
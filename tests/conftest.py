@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 
 
 def pytest_configure():
@@ -26,8 +28,106 @@ def cleanup_log_dir():
     log_file_path.unlink(missing_ok=True)
 
 
+@pytest.fixture(scope="session")
+def appointment_pool():
+    """Random appointments generated once per session; tests must not modify them."""
+    from tests.utils import shared_appointment_pool
+
+    return shared_appointment_pool()
+
+
+@pytest.fixture
+def rng():
+    """A private NumPy generator for the test, reproducible via MEDICONY_TEST_SEED."""
+    from tests.utils import spawn_rng
+
+    return spawn_rng()
+
+
+@pytest.fixture
+def sample_appointments(appointment_pool, rng):
+    """Draw n distinct appointments from the shared pool."""
+    return lambda n: [appointment_pool[i] for i in rng.choice(len(appointment_pool), n, replace=False)]
+
+
 @pytest.fixture
 def mock_api_client():
     api_client = MagicMock()
     api_client.find_filters.return_value = {"clinics": [{"id": "2024", "value": "Test Clinic"}]}
     return api_client
+
+
+class DummyAPI:
+    async def update_watch_metadata(self, watch):
+        return
+
+
+def _enable_sqlite_savepoints(engine):
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT handling; let SQLAlchemy emit it instead.
+    # The in-memory database lives on the single static connection, so switch that one to autocommit mode.
+    with engine.connect() as connection:
+        connection.connection.driver_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+# Session-scoped databases are per process, so every pytest-xdist worker gets its own in-memory copy.
+# Tests never use them directly: the db_logic/db_client fixtures below wrap them in a rolled-back transaction.
+@pytest.fixture(scope="session")
+def _db_logic_session():
+    from tests.test_db_helper import SqliteDbLogic
+
+    logic = SqliteDbLogic(":memory:")
+    _enable_sqlite_savepoints(logic.engine)
+    return logic
+
+
+@pytest.fixture(scope="session")
+def _db_client_session():
+    from tests.test_db_helper import SqliteDbClient
+
+    client = SqliteDbClient(":memory:")
+    _enable_sqlite_savepoints(client.db.engine)
+    return client
+
+
+@pytest.fixture
+def rollback_db(_db_logic_session, _db_client_session):
+    """Run the test in a transaction that is rolled back afterwards, so the schema is created only once."""
+    transactions = []
+    for db in (_db_logic_session, _db_client_session.db):
+        connection = db.engine.connect()
+        transactions.append((db, db.SessionLocal, connection, connection.begin()))
+        # Commits made by the code under test only release a SAVEPOINT inside the outer transaction.
+        # Objects are not expired on commit, so reading e.g. a new row's id does not trigger another SELECT.
+        db.SessionLocal = sessionmaker(
+            bind=connection,
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+    yield
+    for db, session_factory, connection, transaction in transactions:
+        transaction.rollback()
+        connection.close()
+        db.SessionLocal = session_factory
+
+
+@pytest.fixture
+def db_logic(_db_logic_session, rollback_db):
+    return _db_logic_session
+
+
+@pytest.fixture
+def db_client(_db_client_session, rollback_db):
+    return _db_client_session
+
+
+@pytest.fixture
+def watch_service(db_client):
+    from src.medicover.services.watch_service import WatchService
+
+    return WatchService(api_client=DummyAPI(), db_client=db_client)  # type: ignore
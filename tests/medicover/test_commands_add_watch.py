@@ -93,7 +93,7 @@ async def test_add_watch_abort() -> None:
     the state is cleared and the conversation ends.
     """
     # Arrange
-    state = create_mock_fsm_context()
+    state = create_mock_fsm_context(track=True)
     watch_service = MagicMock()
     watch_service.list_available_filters = AsyncMock(return_value=[])
     watch_service.add_watch = MagicMock()
@@ -128,7 +128,7 @@ async def test_add_watch_invalid_region() -> None:
     an error message is shown and the user is prompted again.
     """
     # Arrange
-    state = create_mock_fsm_context()
+    state = create_mock_fsm_context(track=True)
     watch_service = MagicMock()
     watch_service.list_available_filters = AsyncMock(return_value=[])
     watch_service.add_watch = MagicMock()
@@ -7,6 +7,8 @@ single appointment matching, and date range matching functionality.
 
 import datetime
 
+import pytest
+
 from src.id_value_util import IdValue
 from src.medicover.appointment import Appointment
 from src.medicover.matchers import (
@@ -16,6 +18,36 @@ from src.medicover.matchers import (
     match_within_date_range,
 )
 
+_REF_DT = datetime.datetime(2025, 3, 15, 10, 0, 0)
+
+
+def _make_appointment(date_time="2025-03-15T10:00:00", specialty_id=789, clinic_id=123, doctor_id=456):
+    """Build a test appointment by setting attributes directly, bypassing the API dict parsing."""
+    appointment = Appointment()
+    appointment.date_time = datetime.datetime.fromisoformat(date_time)
+    appointment.specialty = IdValue(specialty_id, "Test Specialty")
+    appointment.clinic = IdValue(clinic_id, "Test Clinic")
+    appointment.doctor = IdValue(doctor_id, "Dr. Test")
+    appointment.visit_type = "Center"
+    return appointment
+
+
+class _DateTimeGuardedAppointment(Appointment):
+    """Appointment whose date_time must not be read."""
+
+    @property
+    def date_time(self):
+        raise AssertionError("date_time should not be accessed")
+
+
+@pytest.fixture(scope="class")
+def all_apps():
+    """Appointments with default filters shared by the date range tests, keyed by date."""
+    return {
+        date: _make_appointment(date_time=f"{date}T10:00:00")
+        for date in ("2025-03-14", "2025-03-15", "2025-03-16", "2025-03-18", "2025-12-31")
+    }
+
 
 class TestIsExcluded:
     """Test cases for the is_excluded function."""
@@ -179,167 +211,124 @@ class TestMatchSingleAppointmentToBeCanceled:
 class TestMatchSingleAppointment:
     """Test cases for the match_single_appointment function."""
 
-    def create_test_appointment(self, specialty_id=789, clinic_id=123, doctor_id=456, date_time="2025-03-15T10:00:00"):
-        """Helper method to create test appointment."""
-        appointment_data = {
-            "appointmentDate": date_time,
-            "clinic": {"id": str(clinic_id), "name": "Test Clinic"},
-            "doctor": {"id": str(doctor_id), "name": "Dr. Test"},
-            "specialty": {"id": str(specialty_id), "name": "Test Specialty"},
-            "visitType": "Center",
-        }
-        return Appointment(appointment_data)
-
-    def test_exact_match(self):
-        """Test exact matching of appointment."""
-        appointment = self.create_test_appointment()
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        result = match_single_appointment(789, 123, 456, date_time, appointments)
-        assert result == appointment
-
-    def test_match_without_clinic_filter(self):
-        """Test matching when clinic filter is None."""
-        appointment = self.create_test_appointment(clinic_id=999)
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        result = match_single_appointment(789, None, 456, date_time, appointments)
-        assert result == appointment
-
-    def test_match_without_doctor_filter(self):
-        """Test matching when doctor filter is None."""
-        appointment = self.create_test_appointment(doctor_id=999)
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        result = match_single_appointment(789, 123, None, date_time, appointments)
-        assert result == appointment
-
-    def test_match_date_only(self):
-        """Test matching by date only when exact_date_match=True, exact_time_match=False."""
-        appointment = self.create_test_appointment(date_time="2025-03-15T14:30:00")
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")  # Same date, different time
+    @pytest.mark.parametrize(
+        "overrides, clinic, doctor, exact_time_match, exact_date_match, expected_match",
+        [
+            pytest.param({}, 123, 456, True, True, True, id="exact_match"),
+            pytest.param({"clinic_id": 999}, None, 456, True, True, True, id="without_clinic_filter"),
+            pytest.param({"doctor_id": 999}, 123, None, True, True, True, id="without_doctor_filter"),
+            # Same date, different time
+            pytest.param({"date_time": "2025-03-15T14:30:00"}, 123, 456, False, True, True, id="date_only"),
+            # Different date, neither time nor date match required
+            pytest.param({"date_time": "2025-03-16T14:30:00"}, 123, 456, False, False, True, id="no_time_or_date"),
+            pytest.param({"specialty_id": 999}, 123, 456, True, True, False, id="different_specialty"),
+            pytest.param({"clinic_id": 999}, 123, 456, True, True, False, id="different_clinic"),
+            pytest.param({"doctor_id": 999}, 123, 456, True, True, False, id="different_doctor"),
+            # Only exact time should matter
+            pytest.param(
+                {"date_time": "2025-03-15T14:00:00"}, 123, 456, True, False, False, id="different_time_exact_time_only"
+            ),
+            # Should match if EITHER time OR date matches
+            pytest.param(
+                {"date_time": "2025-03-15T14:00:00"}, 123, 456, True, True, True, id="different_time_same_date"
+            ),
+            # Only exact date should matter
+            pytest.param(
+                {"date_time": "2025-03-16T10:00:00"}, 123, 456, False, True, False, id="different_date_exact_date_only"
+            ),
+        ],
+    )
+    def test_single_appointment(self, overrides, clinic, doctor, exact_time_match, exact_date_match, expected_match):
+        """Test matching a single appointment against the filters and the reference date/time."""
+        appointment = _make_appointment(**overrides)
 
         result = match_single_appointment(
-            789, 123, 456, date_time, appointments, exact_time_match=False, exact_date_match=True
+            789,
+            clinic,
+            doctor,
+            _REF_DT,
+            [appointment],
+            exact_time_match=exact_time_match,
+            exact_date_match=exact_date_match,
         )
-        assert result == appointment
+        assert (result is appointment) == expected_match
 
-    def test_no_time_or_date_match_required(self):
-        """Test matching when both exact_time_match and exact_date_match are False."""
-        appointment = self.create_test_appointment(date_time="2025-03-16T14:30:00")  # Different date
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        result = match_single_appointment(
-            789, 123, 456, date_time, appointments, exact_time_match=False, exact_date_match=False
+    def test_match_api_appointment_with_int_filters(self):
+        """Test that string IDs from the API payload are matched against integer filters."""
+        appointment = Appointment(
+            {
+                "appointmentDate": "2025-03-15T10:00:00",
+                "clinic": {"id": "123", "name": "Test Clinic"},
+                "doctor": {"id": "456", "name": "Dr. Test"},
+                "specialty": {"id": "789", "name": "Test Specialty"},
+                "visitType": "Center",
+            }
         )
-        assert result == appointment
 
-    def test_no_match_different_specialty(self):
-        """Test no match when specialty doesn't match."""
-        appointment = self.create_test_appointment(specialty_id=999)
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
+        result = match_single_appointment(789, 123, 456, _REF_DT, [appointment])
+        assert result is appointment
 
-        result = match_single_appointment(789, 123, 456, date_time, appointments)
-        assert result is None
-
-    def test_no_match_different_clinic(self):
-        """Test no match when clinic filter doesn't match."""
-        appointment = self.create_test_appointment(clinic_id=999)
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        result = match_single_appointment(789, 123, 456, date_time, appointments)
-        assert result is None
+    def test_multiple_appointments_first_match_returned(self):
+        """Test that first matching appointment is returned when multiple matches exist."""
+        appointment1 = _make_appointment()
+        appointment2 = _make_appointment()
+        appointments = [appointment1, appointment2]
 
-    def test_no_match_different_doctor(self):
-        """Test no match when doctor filter doesn't match."""
-        appointment = self.create_test_appointment(doctor_id=999)
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
+        result = match_single_appointment(789, 123, 456, _REF_DT, appointments)
+        assert result is appointment1
 
-        result = match_single_appointment(789, 123, 456, date_time, appointments)
+    def test_empty_appointments_list(self):
+        """Test with empty appointments list."""
+        result = match_single_appointment(789, 123, 456, _REF_DT, [])
         assert result is None
 
-    def test_no_match_different_time_and_exact_time_only(self):
-        """Test no match when time doesn't match and we want exact time match only."""
-        appointment = self.create_test_appointment(date_time="2025-03-15T14:00:00")
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        # When exact_time_match=True and exact_date_match=False, only exact time should matter
-        result = match_single_appointment(
-            789, 123, 456, date_time, appointments, exact_time_match=True, exact_date_match=False
-        )
+    @pytest.mark.parametrize(
+        "specialty_id, clinic_id, doctor_id",
+        [
+            pytest.param(999, 123, 456, id="different_specialty"),
+            pytest.param(789, 999, 456, id="different_clinic"),
+            pytest.param(789, 123, 999, id="different_doctor"),
+        ],
+    )
+    def test_id_mismatch_skips_date_checks(self, specialty_id, clinic_id, doctor_id):
+        """Test that an ID mismatch rejects the appointment without touching its date/time."""
+        appointment = _DateTimeGuardedAppointment()
+        appointment.specialty = IdValue(specialty_id, "Test Specialty")
+        appointment.clinic = IdValue(clinic_id, "Test Clinic")
+        appointment.doctor = IdValue(doctor_id, "Dr. Test")
+
+        result = match_single_appointment(789, 123, 456, _REF_DT, [appointment])
         assert result is None
 
-    def test_match_different_time_but_same_date_with_exact_date_match(self):
-        """Test match when time is different but date matches and exact_date_match=True."""
-        appointment = self.create_test_appointment(date_time="2025-03-15T14:00:00")
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
+    def test_match_with_id_set_filters(self):
+        """Test matching when clinic and doctor filters are sets of accepted IDs."""
+        appointment = _make_appointment(clinic_id=124, doctor_id=457)
 
-        # When both exact_time_match=True and exact_date_match=True (default),
-        # it should match if EITHER time OR date matches
-        result = match_single_appointment(789, 123, 456, date_time, appointments)
-        assert result == appointment
+        result = match_single_appointment(789, frozenset({123, 124}), frozenset({456, 457}), _REF_DT, [appointment])
+        assert result is appointment
 
-    def test_no_match_different_date_and_exact_date_only(self):
-        """Test no match when date doesn't match and we want exact date match only."""
-        appointment = self.create_test_appointment(date_time="2025-03-16T10:00:00")
-        appointments = [appointment]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        # When exact_time_match=False and exact_date_match=True, only exact date should matter
-        result = match_single_appointment(
-            789, 123, 456, date_time, appointments, exact_time_match=False, exact_date_match=True
-        )
+        result = match_single_appointment(789, frozenset({123, 125}), None, _REF_DT, [appointment])
         assert result is None
 
-    def test_multiple_appointments_first_match_returned(self):
-        """Test that first matching appointment is returned when multiple matches exist."""
-        appointment1 = self.create_test_appointment()
-        appointment2 = self.create_test_appointment()
-        appointments = [appointment1, appointment2]
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        result = match_single_appointment(789, 123, 456, date_time, appointments)
-        assert result == appointment1
+    def test_empty_id_set_matches_nothing(self):
+        """Test that an empty set of accepted IDs matches no appointment, unlike None."""
+        appointment = _make_appointment(clinic_id=123, doctor_id=456)
 
-    def test_empty_appointments_list(self):
-        """Test with empty appointments list."""
-        date_time = datetime.datetime.fromisoformat("2025-03-15T10:00:00")
-
-        result = match_single_appointment(789, 123, 456, date_time, [])
-        assert result is None
+        assert match_single_appointment(789, frozenset(), None, _REF_DT, [appointment]) is None
+        assert match_single_appointment(789, None, frozenset(), _REF_DT, [appointment]) is None
+        assert match_single_appointment(789, None, None, _REF_DT, [appointment]) is appointment
 
 
 class TestMatchWithinDateRange:
     """Test cases for the match_within_date_range function."""
 
-    def create_test_appointment(self, specialty_id=789, clinic_id=123, doctor_id=456, date_time="2025-03-15T10:00:00"):
-        """Helper method to create test appointment."""
-        appointment_data = {
-            "appointmentDate": date_time,
-            "clinic": {"id": str(clinic_id), "name": "Test Clinic"},
-            "doctor": {"id": str(doctor_id), "name": "Dr. Test"},
-            "specialty": {"id": str(specialty_id), "name": "Test Specialty"},
-            "visitType": "Center",
-        }
-        return Appointment(appointment_data)
-
-    def test_match_within_date_range(self):
+    def test_match_within_date_range(self, all_apps):
         """Test matching appointments within date range."""
         appointments = [
-            self.create_test_appointment(date_time="2025-03-14T10:00:00"),  # Before range
-            self.create_test_appointment(date_time="2025-03-15T10:00:00"),  # In range
-            self.create_test_appointment(date_time="2025-03-16T10:00:00"),  # In range
-            self.create_test_appointment(date_time="2025-03-18T10:00:00"),  # After range
+            all_apps["2025-03-14"],  # Before range
+            all_apps["2025-03-15"],  # In range
+            all_apps["2025-03-16"],  # In range
+            all_apps["2025-03-18"],  # After range
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -347,29 +336,29 @@ class TestMatchWithinDateRange:
 
         result = match_within_date_range(789, 123, 456, start_date, end_date, appointments)
         assert len(result) == 2
-        assert result[0].date_time.date() == datetime.date(2025, 3, 15)
-        assert result[1].date_time.date() == datetime.date(2025, 3, 16)
+        assert result[0].date_only == datetime.date(2025, 3, 15)
+        assert result[1].date_only == datetime.date(2025, 3, 16)
 
-    def test_match_without_end_date(self):
+    def test_match_without_end_date(self, all_apps):
         """Test matching when end_date is None (should use datetime.date.max)."""
         appointments = [
-            self.create_test_appointment(date_time="2025-03-14T10:00:00"),  # Before range
-            self.create_test_appointment(date_time="2025-03-15T10:00:00"),  # In range
-            self.create_test_appointment(date_time="2025-12-31T10:00:00"),  # In range (far future)
+            all_apps["2025-03-14"],  # Before range
+            all_apps["2025-03-15"],  # In range
+            all_apps["2025-12-31"],  # In range (far future)
         ]
 
         start_date = datetime.date(2025, 3, 15)
 
         result = match_within_date_range(789, 123, 456, start_date, None, appointments)
         assert len(result) == 2
-        assert result[0].date_time.date() == datetime.date(2025, 3, 15)
-        assert result[1].date_time.date() == datetime.date(2025, 12, 31)
+        assert result[0].date_only == datetime.date(2025, 3, 15)
+        assert result[1].date_only == datetime.date(2025, 12, 31)
 
     def test_match_without_clinic_filter(self):
         """Test matching when clinic filter is None."""
         appointments = [
-            self.create_test_appointment(clinic_id=999, date_time="2025-03-15T10:00:00"),
-            self.create_test_appointment(clinic_id=888, date_time="2025-03-16T10:00:00"),
+            _make_appointment(clinic_id=999, date_time="2025-03-15T10:00:00"),
+            _make_appointment(clinic_id=888, date_time="2025-03-16T10:00:00"),
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -381,8 +370,8 @@ class TestMatchWithinDateRange:
     def test_match_without_doctor_filter(self):
         """Test matching when doctor filter is None."""
         appointments = [
-            self.create_test_appointment(doctor_id=999, date_time="2025-03-15T10:00:00"),
-            self.create_test_appointment(doctor_id=888, date_time="2025-03-16T10:00:00"),
+            _make_appointment(doctor_id=999, date_time="2025-03-15T10:00:00"),
+            _make_appointment(doctor_id=888, date_time="2025-03-16T10:00:00"),
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -394,7 +383,7 @@ class TestMatchWithinDateRange:
     def test_no_matches_different_specialty(self):
         """Test no matches when specialty doesn't match."""
         appointments = [
-            self.create_test_appointment(specialty_id=999, date_time="2025-03-15T10:00:00"),
+            _make_appointment(specialty_id=999, date_time="2025-03-15T10:00:00"),
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -406,7 +395,7 @@ class TestMatchWithinDateRange:
     def test_no_matches_different_clinic(self):
         """Test no matches when clinic filter doesn't match."""
         appointments = [
-            self.create_test_appointment(clinic_id=999, date_time="2025-03-15T10:00:00"),
+            _make_appointment(clinic_id=999, date_time="2025-03-15T10:00:00"),
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -418,7 +407,7 @@ class TestMatchWithinDateRange:
     def test_no_matches_different_doctor(self):
         """Test no matches when doctor filter doesn't match."""
         appointments = [
-            self.create_test_appointment(doctor_id=999, date_time="2025-03-15T10:00:00"),
+            _make_appointment(doctor_id=999, date_time="2025-03-15T10:00:00"),
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -427,11 +416,11 @@ class TestMatchWithinDateRange:
         result = match_within_date_range(789, 123, 456, start_date, end_date, appointments)
         assert len(result) == 0
 
-    def test_no_matches_outside_date_range(self):
+    def test_no_matches_outside_date_range(self, all_apps):
         """Test no matches when all appointments are outside date range."""
         appointments = [
-            self.create_test_appointment(date_time="2025-03-14T10:00:00"),  # Before range
-            self.create_test_appointment(date_time="2025-03-18T10:00:00"),  # After range
+            all_apps["2025-03-14"],  # Before range
+            all_apps["2025-03-18"],  # After range
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -440,11 +429,11 @@ class TestMatchWithinDateRange:
         result = match_within_date_range(789, 123, 456, start_date, end_date, appointments)
         assert len(result) == 0
 
-    def test_edge_case_start_date_equals_end_date(self):
+    def test_edge_case_start_date_equals_end_date(self, all_apps):
         """Test edge case when start_date equals end_date."""
         appointments = [
-            self.create_test_appointment(date_time="2025-03-15T10:00:00"),
-            self.create_test_appointment(date_time="2025-03-16T10:00:00"),
+            all_apps["2025-03-15"],
+            all_apps["2025-03-16"],
         ]
 
         start_date = datetime.date(2025, 3, 15)
@@ -452,7 +441,7 @@ class TestMatchWithinDateRange:
 
         result = match_within_date_range(789, 123, 456, start_date, end_date, appointments)
         assert len(result) == 1
-        assert result[0].date_time.date() == datetime.date(2025, 3, 15)
+        assert result[0].date_only == datetime.date(2025, 3, 15)
 
     def test_empty_appointments_list(self):
         """Test with empty appointments list."""
@@ -461,3 +450,30 @@ class TestMatchWithinDateRange:
 
         result = match_within_date_range(789, 123, 456, start_date, end_date, [])
         assert len(result) == 0
+
+    def test_match_with_id_set_filters(self):
+        """Test matching when clinic and doctor filters are sets of accepted IDs."""
+        appointments = [
+            _make_appointment(clinic_id=123, doctor_id=456, date_time="2025-03-15T10:00:00"),
+            _make_appointment(clinic_id=124, doctor_id=457, date_time="2025-03-16T10:00:00"),
+            _make_appointment(clinic_id=999, doctor_id=456, date_time="2025-03-16T12:00:00"),
+        ]
+
+        start_date = datetime.date(2025, 3, 15)
+        end_date = datetime.date(2025, 3, 17)
+
+        result = match_within_date_range(
+            789, frozenset({123, 124}), frozenset({456, 457}), start_date, end_date, appointments
+        )
+        assert result == appointments[:2]
+
+    def test_empty_id_set_matches_nothing(self):
+        """Test that an empty set of accepted IDs matches no appointment, unlike None."""
+        appointments = [_make_appointment(clinic_id=123, doctor_id=456, date_time="2025-03-16T10:00:00")]
+
+        start_date = datetime.date(2025, 3, 15)
+        end_date = datetime.date(2025, 3, 17)
+
+        assert match_within_date_range(789, frozenset(), None, start_date, end_date, appointments) == []
+        assert match_within_date_range(789, None, frozenset(), start_date, end_date, appointments) == []
+        assert match_within_date_range(789, None, None, start_date, end_date, appointments) == appointments
@@ -6,21 +6,56 @@ formatting and displaying of appointments, watches, and other entities
 for various outputs including console, log, and user interfaces.
 """
 
-from typing import List
+from typing import Callable, List, Tuple
 
-from src.medicover.presenters import format_entity_by_lines, format_message_chunks, log_entities_with_info
-from tests.utils import generate_random_appointment, generate_random_appointments
+import pytest
 
+from src.medicover.appointment import Appointment
+from src.medicover.presenters import (
+    format_entity_by_lines,
+    format_message_chunks,
+    log_entities,
+    log_entities_with_info,
+)
 
-def test_format_single_appointment() -> None:
+
+class FakeLog:
+    """Minimal logger stand-in that records the messages passed to info()."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def info(self, message: str) -> None:
+        self.lines.append(message)
+
+
+@pytest.fixture(scope="session")
+def random_appointments_10(appointment_pool: Tuple[Appointment, ...]) -> List[Appointment]:
+    """Ten random appointments taken from the session-wide pool."""
+    return list(appointment_pool[:10])
+
+
+@pytest.fixture(scope="session")
+def expected_formatted(random_appointments_10: List[Appointment]) -> List[str]:
+    """Expected format_entity_by_lines output for random_appointments_10."""
+    return [
+        f"Date: {ap.date_time}\nClinic: {ap.clinic.value}\nDoctor: {ap.doctor.value}\nSpecialty: {ap.specialty.value}\nType: {ap.visit_type}\nBooked: Yes (ID: {ap.booking_identifier})\nAccount: N/A"
+        for ap in random_appointments_10
+    ]
+
+
+def test_format_single_appointment(sample_appointments: Callable[[int], List[Appointment]]) -> None:
     """
     Test formatting a single appointment into a human-readable string.
 
     Verifies that format_entity_by_lines correctly formats a single appointment
     with all its fields into a readable multi-line string.
+
+    Args:
+        sample_appointments: Draws appointments from the shared pool.
     """
     # Arrange
-    ap = generate_random_appointment()
+    (ap,) = sample_appointments(1)
     expected_format = [
         f"Date: {ap.date_time}\nClinic: {ap.clinic.value}\nDoctor: {ap.doctor.value}\nSpecialty: {ap.specialty.value}\nType: {ap.visit_type}\nBooked: Yes (ID: {ap.booking_identifier})\nAccount: N/A"
     ]
@@ -32,26 +67,18 @@ def test_format_single_appointment() -> None:
     assert formatted == expected_format, "Single appointment should be formatted correctly"
 
 
-def test_format_many_appointments() -> None:
+def test_format_many_appointments(random_appointments_10: List[Appointment], expected_formatted: List[str]) -> None:
     """
     Test formatting multiple appointments into human-readable strings.
 
     Verifies that format_entity_by_lines correctly formats a list of appointments
     with all their fields into readable multi-line strings.
     """
-    # Arrange
-    aps = generate_random_appointments(10)
-    expected_format: List[str] = []
-    for ap in aps:
-        expected_format.append(
-            f"Date: {ap.date_time}\nClinic: {ap.clinic.value}\nDoctor: {ap.doctor.value}\nSpecialty: {ap.specialty.value}\nType: {ap.visit_type}\nBooked: Yes (ID: {ap.booking_identifier})\nAccount: N/A"
-        )
-
     # Act
-    formatted = format_entity_by_lines(aps)
+    formatted = format_entity_by_lines(random_appointments_10)
 
     # Assert
-    assert formatted == expected_format, "Multiple appointments should be formatted correctly"
+    assert formatted == expected_formatted, "Multiple appointments should be formatted correctly"
 
 
 def test_format_message_chunks() -> None:
@@ -82,7 +109,7 @@ def test_format_message_chunks() -> None:
     assert formatted == expected, "Message chunks should be formatted with separators"
 
 
-def test_log_appointments(mocker) -> None:
+def test_log_appointments(mocker, sample_appointments: Callable[[int], List[Appointment]]) -> None:
     """
     Test logging of appointments.
 
@@ -91,28 +118,51 @@ def test_log_appointments(mocker) -> None:
 
     Args:
         mocker: The pytest-mock fixture.
+        sample_appointments: Draws appointments from the shared pool.
     """
     # Arrange
-    mock_log = mocker.patch("src.medicover.presenters.log")
-    appointments = generate_random_appointments(5)
+    fake_log = FakeLog()
+    mocker.patch("src.medicover.presenters.log", fake_log)
+    appointments = sample_appointments(5)
 
     # Act
     log_entities_with_info(appointments)
 
     # Assert
-    expected_call_count = (len(str(appointments[0]).splitlines()) + 1) * len(appointments) + 2
-    assert mock_log.info.call_count == expected_call_count, "Should log the correct number of lines"
+    expected_call_count = 2 * len(appointments) + 2
+    assert len(fake_log.lines) == expected_call_count, "Should log one record per appointment and separator"
 
     # Verify first lines are header and separator
-    assert mock_log.info.call_args_list[0][0][0] == "Items found:", "First log should be a header"
-    assert mock_log.info.call_args_list[1][0][0] == "-" * 50, "Second log should be a separator"
+    assert fake_log.lines[0] == "Items found:", "First log should be a header"
+    assert fake_log.lines[1] == "-" * 50, "Second log should be a separator"
 
     # Verify appointment details are logged correctly
-    i = 2  # Skip header and first separator
-    for ap in appointments:
-        # Get the logged lines for the current appointment (7 lines per appointment now)
-        all_log_params = [val[0][0] for val in mock_log.info.call_args_list[i : i + 7]]
+    for n, ap in enumerate(appointments):
+        i = 2 + 2 * n  # Skip header and first separator, then one record + separator per appointment
         expected_lines = f"Date: {ap.date_time}\nClinic: {ap.clinic.value}\nDoctor: {ap.doctor.value}\nSpecialty: {ap.specialty.value}\nType: {ap.visit_type}\nBooked: Yes (ID: {ap.booking_identifier})\nAccount: N/A".splitlines()
 
-        assert all_log_params == expected_lines, f"Appointment {i // 8} should be logged correctly"
-        i += 8  # 7 lines + 1 separator between appointments
+        assert fake_log.lines[i].splitlines() == expected_lines, f"Appointment {n} should be logged correctly"
+        assert fake_log.lines[i + 1] == "-" * 50, "Each appointment should be followed by a separator"
+
+
+def test_log_entities(mocker, sample_appointments: Callable[[int], List[Appointment]]) -> None:
+    """
+    Test that log_entities logs one record per entity, each preceded by a separator.
+
+    Args:
+        mocker: The pytest-mock fixture.
+        sample_appointments: Draws appointments from the shared pool.
+    """
+    # Arrange
+    fake_log = FakeLog()
+    mocker.patch("src.medicover.presenters.log", fake_log)
+    appointments = sample_appointments(3)
+
+    # Act
+    log_entities(appointments)
+
+    # Assert
+    expected = []
+    for ap in appointments:
+        expected += ["-" * 50, str(ap)]
+    assert fake_log.lines == expected + ["-" * 50]
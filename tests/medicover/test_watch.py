@@ -5,12 +5,33 @@ This module contains tests for the Watch class, WatchTimeRange, and related
 helper functions to ensure correct initialization, validation and operations.
 """
 
+import copy
 from datetime import date, time, timedelta
 
+import pytest
 from pytest import raises
 
 from src.medicover.watch import Watch, WatchActiveStatus, WatchTimeRange, is_within
 
+_D_2137_09_01 = date(2137, 9, 1)
+_D_2137_09_17 = date(2137, 9, 17)
+_D_2027_02_21 = date(2027, 2, 21)
+_D_2027_09_17 = date(2027, 9, 17)
+_TR_12_13 = WatchTimeRange("12:12:12-13:13:13")
+
+_EXPECTED_STR_SINGLE = "ID 91\nRegion: 92\nCity: zzz\nType: Standard\nSpecialty: 93\nClinic: 94\nDoctor: 95\nDate range: 2027-02-21–2027-09-17\nTime range: 10:30:00-*\nAutobook: False\nExclusions: doctor:111,222;clinic:333,444\nAccount: default"
+_EXPECTED_STR_MULTI = "ID 91\nRegion: 92\nCity: zzz\nType: Standard\nSpecialty: 93, 96, 99\nClinic: 94\nDoctor: 95\nDate range: 2027-02-21–2027-09-17\nTime range: 10:30:00-*\nAutobook: False\nExclusions: None\nAccount: default"
+_EXPECTED_DESCRIPTIVE_TEMPLATE = "ID 51\nRegion: region52 (52)\nCity: yyy\nType: DiagnosticProcedure\nSpecialty: {specialties}\nClinic: clinic54 (54)\nDoctor: doctor55 (55)\nDate range: 2137-09-01–2137-09-17\nTime range: 12:12:12-13:13:13\nAutobook: True\nExclusions: {exclusions}\nAccount: default"
+_EXPECTED_SHORT_TEMPLATE = "ID 51; r: 52; ci: yyy; t: DiagnosticProcedure; s: {specialties}; cl: 54; d: 55; dr: 2137-09-01–2137-09-17; tr: 12:15:36-*; ab: True; excl: {exclusions}; acc: default"
+
+_SPECIALTY_IDS = pytest.mark.parametrize(
+    "specialty_ids",
+    [
+        pytest.param([53], id="single"),
+        pytest.param([53, 56, 59], id="multi"),
+    ],
+)
+
 
 def test_watch_invalid_initialization():
     """Test that Watch initialization fails with invalid arguments."""
@@ -19,318 +40,228 @@ def test_watch_invalid_initialization():
         Watch.from_tuple((1, 2))  # Too few arguments
 
 
-def test_watch_initialization_with_defaults():
-    """Test initializing a Watch with minimal arguments and default values."""
-    # Arrange
-    init = (1, 2, "aaa", [3], 4, 5, date.min)
-
+@_SPECIALTY_IDS
+@pytest.mark.parametrize(
+    "init, expected",
+    [
+        pytest.param(
+            (1, 2, "aaa", 4, 5, date.min),
+            {
+                "id": 1,
+                "region_id": 2,
+                "city": "aaa",
+                "clinic_id": 4,
+                "doctor_id": 5,
+                "start_date": date.min,
+            },
+            id="defaults",
+        ),
+        pytest.param(
+            (11, 22, "bbb", 44, 55, _D_2137_09_01, _D_2137_09_17, _TR_12_13, False),
+            {
+                "id": 11,
+                "region_id": 22,
+                "city": "bbb",
+                "clinic_id": 44,
+                "doctor_id": 55,
+                "start_date": _D_2137_09_01,
+                "end_date": _D_2137_09_17,
+                "time_range": _TR_12_13,
+                "auto_book": False,
+            },
+            id="dedicated_types",
+        ),
+        pytest.param(
+            (11, 22, "xxxx", 44, 55, "2137-09-01", "2137-09-17", "12:12:12-13:13:13", True),
+            {
+                "id": 11,
+                "region_id": 22,
+                "city": "xxxx",
+                "clinic_id": 44,
+                "doctor_id": 55,
+                "start_date": _D_2137_09_01,
+                "end_date": _D_2137_09_17,
+                "time_range": _TR_12_13,
+                "auto_book": True,
+            },
+            id="strings",
+        ),
+    ],
+)
+def test_watch_initialization(init, expected, specialty_ids):
+    """Test initializing a Watch from tuples using defaults, dedicated types or string values."""
     # Act
-    watch = Watch.from_tuple(init)
+    watch = Watch.from_tuple(init[:3] + (specialty_ids,) + init[3:])
 
     # Assert
-    assert watch.id == 1
-    assert watch.region is not None and watch.region.id == 2
-    assert watch.city == "aaa"
-    assert watch.specialty[0].id == 3
-    assert watch.clinic is not None and watch.clinic.id == 4
-    assert watch.doctor is not None and watch.doctor.id == 5
-    assert watch.start_date == date.min
-
-
-def test_watch_initialization_with_defaults_multiple_specialties():
-    """Test initializing a Watch with multiple specialties."""
-    # Arrange
-    init = (1, 2, "aaa", [3, 6, 9], 4, 5, date.min)
+    assert watch.id == expected["id"]
+    assert watch.region is not None and watch.region.id == expected["region_id"]
+    assert watch.city == expected["city"]
+    assert len(watch.specialty) == len(specialty_ids)
+    for idx, sid in enumerate(specialty_ids):
+        assert watch.specialty[idx].id == sid
+    assert watch.clinic is not None and watch.clinic.id == expected["clinic_id"]
+    assert watch.doctor is not None and watch.doctor.id == expected["doctor_id"]
+    assert watch.start_date == expected["start_date"]
+    if "end_date" in expected:
+        assert watch.end_date == expected["end_date"]
+    if "time_range" in expected:
+        assert watch.time_range == expected["time_range"]
+    if "auto_book" in expected:
+        assert watch.auto_book == expected["auto_book"]
+
+
+@pytest.fixture(scope="module")
+def canonical_watch():
+    """A multi-specialty Watch built once and shared by the read-only tests of this module."""
+    return Watch.from_tuple(
+        (
+            91,
+            92,
+            "zzz",
+            [93, 96, 99],
+            94,
+            95,
+            _D_2027_02_21,
+            _D_2027_09_17,
+            WatchTimeRange("10:30"),
+            False,
+            None,
+            "Standard",
+        )
+    )
 
-    # Act
-    watch = Watch.from_tuple(init)
 
-    # Assert
-    assert watch.id == 1
-    assert watch.region is not None and watch.region.id == 2
-    assert watch.city == "aaa"
-    assert watch.specialty[0].id == 3
-    assert watch.specialty[1].id == 6
-    assert watch.specialty[2].id == 9
-    assert watch.clinic is not None and watch.clinic.id == 4
-    assert watch.doctor is not None and watch.doctor.id == 5
-    assert watch.start_date == date.min
-
-
-def test_watch_initialization_full_with_dedicated_types():
-    """Test initializing a Watch with full set of parameters using dedicated types."""
-    init = (
-        11,
-        22,
-        "bbb",
-        [33],
-        44,
-        55,
-        date.fromisoformat("2137-09-01"),
-        date.fromisoformat("2137-09-17"),
-        WatchTimeRange("12:12:12-13:13:13"),
-        False,
-    )
-    watch = Watch.from_tuple(init)
-
-    assert watch.id == 11
-    assert watch.region is not None and watch.region.id == 22
-    assert watch.city == "bbb"
-    assert watch.specialty[0].id == 33
-    assert watch.clinic is not None and watch.clinic.id == 44
-    assert watch.doctor is not None and watch.doctor.id == 55
-    assert watch.start_date == date.fromisoformat("2137-09-01")
-    assert watch.end_date == date.fromisoformat("2137-09-17")
-    assert watch.time_range == WatchTimeRange("12:12:12-13:13:13")
-    assert not watch.auto_book
-
-
-def test_watch_initialization_full_with_dedicated_types_multiple_specialties():
-    """Test initializing a Watch with full set of parameters and multiple specialties."""
-    init = (
-        11,
-        22,
-        "bbb",
-        [33, 66, 99],
-        44,
-        55,
-        date.fromisoformat("2137-09-01"),
-        date.fromisoformat("2137-09-17"),
-        WatchTimeRange("12:12:12-13:13:13"),
-        False,
-    )
-    watch = Watch.from_tuple(init)
-
-    assert watch.id == 11
-    assert watch.region is not None and watch.region.id == 22
-    assert watch.city == "bbb"
-    assert watch.specialty[0].id == 33
-    assert watch.specialty[1].id == 66
-    assert watch.specialty[2].id == 99
-    assert watch.clinic is not None and watch.clinic.id == 44
-    assert watch.doctor is not None and watch.doctor.id == 55
-    assert watch.start_date == date.fromisoformat("2137-09-01")
-    assert watch.end_date == date.fromisoformat("2137-09-17")
-    assert watch.time_range == WatchTimeRange("12:12:12-13:13:13")
-    assert not watch.auto_book
-
-
-def test_watch_initialization_full_with_strings():
-    """Test initializing a Watch with full set of parameters using string values."""
-    init = (11, 22, "xxxx", [33], 44, 55, "2137-09-01", "2137-09-17", "12:12:12-13:13:13", True)
-    watch = Watch.from_tuple(init)
-
-    assert watch.id == 11
-    assert watch.region is not None and watch.region.id == 22
-    assert watch.city == "xxxx"
-    assert watch.specialty[0].id == 33
-    assert watch.clinic is not None and watch.clinic.id == 44
-    assert watch.doctor is not None and watch.doctor.id == 55
-    assert watch.start_date == date.fromisoformat("2137-09-01")
-    assert watch.end_date == date.fromisoformat("2137-09-17")
-    assert watch.time_range == WatchTimeRange("12:12:12-13:13:13")
-    assert watch.auto_book
+@pytest.fixture
+def editable_watch(canonical_watch):
+    """A private copy of the canonical Watch for tests that mutate it."""
+    return copy.deepcopy(canonical_watch)
 
 
 def test_watch_to_string():
-    """Test the string representation of a Watch object."""
-    init = (
-        91,
-        92,
-        "zzz",
-        [93],
-        94,
-        95,
-        date.fromisoformat("2027-02-21"),
-        date.fromisoformat("2027-09-17"),
-        WatchTimeRange("10:30"),
-        False,
-        "doctor:111,222;clinic:333,444",
-        "Standard",
+    """Test the string representation of a single-specialty Watch object."""
+    watch = Watch.from_tuple(
+        (
+            91,
+            92,
+            "zzz",
+            [93],
+            94,
+            95,
+            _D_2027_02_21,
+            _D_2027_09_17,
+            WatchTimeRange("10:30"),
+            False,
+            "doctor:111,222;clinic:333,444",
+            "Standard",
+        )
     )
-    watch = Watch.from_tuple(init)
-
-    expected = "ID 91\nRegion: 92\nCity: zzz\nType: Standard\nSpecialty: 93\nClinic: 94\nDoctor: 95\nDate range: 2027-02-21–2027-09-17\nTime range: 10:30:00-*\nAutobook: False\nExclusions: doctor:111,222;clinic:333,444\nAccount: default"
-
-    assert str(watch) == expected
-
 
-def test_watch_to_string_multiple_specialties():
-    """Test the string representation of a Watch object with multiple specialties."""
-    init = (
-        91,
-        92,
-        "zzz",
-        [93, 96, 99],
-        94,
-        95,
-        date.fromisoformat("2027-02-21"),
-        date.fromisoformat("2027-09-17"),
-        WatchTimeRange("10:30"),
-        False,
-        None,
-        "Standard",
-    )
-    watch = Watch.from_tuple(init)
+    assert str(watch) == _EXPECTED_STR_SINGLE
 
-    expected = "ID 91\nRegion: 92\nCity: zzz\nType: Standard\nSpecialty: 93, 96, 99\nClinic: 94\nDoctor: 95\nDate range: 2027-02-21–2027-09-17\nTime range: 10:30:00-*\nAutobook: False\nExclusions: None\nAccount: default"
 
-    assert str(watch) == expected
+def test_watch_to_string_multiple_specialties(canonical_watch):
+    """Test the string representation of a multi-specialty Watch object."""
+    assert str(canonical_watch) == _EXPECTED_STR_MULTI
 
 
-def test_watch_to_string_with_descriptive_values():
+@_SPECIALTY_IDS
+@pytest.mark.parametrize("exclusions", [None, "doctor:111,222,333"])
+def test_watch_to_string_with_descriptive_values(specialty_ids, exclusions):
     """Test the string representation of a Watch object with descriptive values."""
-    init = (
-        51,
-        52,
-        "yyy",
-        [53],
-        54,
-        55,
-        "2137-09-01",
-        "2137-09-17",
-        "12:12:12-13:13:13",
-        True,
-        None,
-        "DiagnosticProcedure",
-    )
-    watch = Watch.from_tuple(init)
-    watch.region.value = "region52"
-    watch.specialty[0].value = "specialty53"
-    if watch.clinic is not None:
-        watch.clinic.value = "clinic54"
-    if watch.doctor is not None:
-        watch.doctor.value = "doctor55"
-
-    expected = "ID 51\nRegion: region52 (52)\nCity: yyy\nType: DiagnosticProcedure\nSpecialty: specialty53 (53)\nClinic: clinic54 (54)\nDoctor: doctor55 (55)\nDate range: 2137-09-01–2137-09-17\nTime range: 12:12:12-13:13:13\nAutobook: True\nExclusions: None\nAccount: default"
-    assert str(watch) == expected
-
-
-def test_watch_to_string_with_descriptive_values_multiple_specialties():
-    """Test the string representation of a Watch object with descriptive values and multiple specialties."""
-    init = (
-        51,
-        52,
-        "yyy",
-        [53, 56, 59],
-        54,
-        55,
-        "2137-09-01",
-        "2137-09-17",
-        "12:12:12-13:13:13",
-        True,
-        "doctor:111,222,333",
-        "DiagnosticProcedure",
+    watch = Watch.from_tuple(
+        (
+            51,
+            52,
+            "yyy",
+            specialty_ids,
+            54,
+            55,
+            "2137-09-01",
+            "2137-09-17",
+            "12:12:12-13:13:13",
+            True,
+            exclusions,
+            "DiagnosticProcedure",
+        )
     )
-    watch = Watch.from_tuple(init)
     # Set descriptive values for the watch
-    watch.region.value = "region52"
-    watch.specialty[0].value = "specialty53"
-    watch.specialty[1].value = "specialty56"
-    watch.specialty[2].value = "specialty59"
+    watch.region.value = f"region{watch.region.id}"
+    for specialty in watch.specialty:
+        specialty.value = f"specialty{specialty.id}"
     if watch.clinic is not None:
         watch.clinic.value = "clinic54"
     if watch.doctor is not None:
         watch.doctor.value = "doctor55"
 
-    expected = "ID 51\nRegion: region52 (52)\nCity: yyy\nType: DiagnosticProcedure\nSpecialty: specialty53 (53), specialty56 (56), specialty59 (59)\nClinic: clinic54 (54)\nDoctor: doctor55 (55)\nDate range: 2137-09-01–2137-09-17\nTime range: 12:12:12-13:13:13\nAutobook: True\nExclusions: doctor:111,222,333\nAccount: default"
+    expected = _EXPECTED_DESCRIPTIVE_TEMPLATE.format(
+        specialties=", ".join(f"specialty{s} ({s})" for s in specialty_ids), exclusions=exclusions
+    )
     assert str(watch) == expected
 
 
-def test_watch_to_short_str():
+@_SPECIALTY_IDS
+@pytest.mark.parametrize("exclusions", [None, "doctor:777,888,999"])
+def test_watch_to_short_str(specialty_ids, exclusions):
     """Test the short string representation of a Watch object."""
-    init = (51, 52, "yyy", [53], 54, 55, "2137-09-01", "2137-09-17", "12:15:36", True, None, "DiagnosticProcedure")
-    watch = Watch.from_tuple(init)
-    expected = "ID 51; r: 52; ci: yyy; t: DiagnosticProcedure; s: 53; cl: 54; d: 55; dr: 2137-09-01–2137-09-17; tr: 12:15:36-*; ab: True; excl: None; acc: default"
-
-    assert watch.short_str() == expected
-
-
-def test_watch_to_short_str_multiple_specialties():
-    """Test the short string representation of a Watch object with multiple specialties."""
-    init = (
-        51,
-        52,
-        "yyy",
-        [53, 56, 59],
-        54,
-        55,
-        "2137-09-01",
-        "2137-09-17",
-        "12:15:36",
-        True,
-        "doctor:777,888,999",
-        "DiagnosticProcedure",
-    )
-    watch = Watch.from_tuple(init)
-    expected = "ID 51; r: 52; ci: yyy; t: DiagnosticProcedure; s: 53, 56, 59; cl: 54; d: 55; dr: 2137-09-01–2137-09-17; tr: 12:15:36-*; ab: True; excl: doctor:777,888,999; acc: default"
-
-    assert watch.short_str() == expected
-
-
-def test_watch_active_status():
-    """Test the active status determination of a Watch object."""
-    starting_point = date.today()
-    threshold = 1  # days
-    w1 = Watch.from_tuple(
+    watch = Watch.from_tuple(
         (
             51,
             52,
             "yyy",
-            [53, 56, 59],
+            specialty_ids,
             54,
             55,
-            starting_point + timedelta(days=2),
+            "2137-09-01",
             "2137-09-17",
             "12:15:36",
             True,
-            None,
+            exclusions,
             "DiagnosticProcedure",
         )
     )
-    assert w1.is_active(threshold, starting_point) == WatchActiveStatus.INACTIVE
 
-    w2 = Watch.from_tuple(
-        (
-            51,
-            52,
-            "yyy",
-            [53, 56, 59],
-            54,
-            55,
-            starting_point - timedelta(days=10),
-            starting_point - timedelta(days=2),
-            "12:15:36",
-            True,
-            "clinic:123,456",
-            "DiagnosticProcedure",
-        )
+    expected = _EXPECTED_SHORT_TEMPLATE.format(
+        specialties=", ".join(str(s) for s in specialty_ids), exclusions=exclusions
     )
-    assert w2.is_active(threshold, starting_point) == WatchActiveStatus.EXPIRED
+    assert watch.short_str() == expected
 
-    w3 = Watch.from_tuple(
-        (
-            51,
-            52,
-            "yyy",
-            [53, 56, 59],
-            54,
-            55,
-            starting_point,
-            starting_point + timedelta(days=10),
-            "12:15:36",
-            True,
-            "doctor:123,456",
-            "DiagnosticProcedure",
-        )
+
+_ACTIVE_STATUS_STARTING_POINT = date.today()
+_ACTIVE_STATUS_THRESHOLD = 1  # days
+
+
+@pytest.mark.parametrize(
+    "start_delta, end_delta, expected",
+    [
+        pytest.param(2, None, WatchActiveStatus.INACTIVE, id="inactive"),
+        pytest.param(-10, -2, WatchActiveStatus.EXPIRED, id="expired"),
+        pytest.param(0, 10, WatchActiveStatus.ACTIVE, id="active"),
+    ],
+)
+def test_watch_active_status(start_delta, end_delta, expected):
+    """Test the active status determination of a Watch object."""
+    starting_point = _ACTIVE_STATUS_STARTING_POINT
+    start = starting_point + timedelta(days=start_delta)
+    end = starting_point + timedelta(days=end_delta) if end_delta is not None else "2137-09-17"
+    watch = Watch.from_tuple(
+        (51, 52, "yyy", [53, 56, 59], 54, 55, start, end, "12:15:36", True, None, "DiagnosticProcedure")
     )
-    assert w3.is_active(threshold, starting_point) == WatchActiveStatus.ACTIVE
 
+    assert watch.is_active(_ACTIVE_STATUS_THRESHOLD, starting_point) == expected
 
-def test_watchtimerange_invalid_param():
-    """Test that WatchTimeRange initialization fails with invalid parameters."""
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        pytest.param(None, id="none"),
+        pytest.param("11:02:03-01:11:11", id="wrong_order"),
+    ],
+)
+def test_watchtimerange_invalid(spec):
+    """Test that WatchTimeRange initialization fails with invalid parameters or end time before start time."""
     with raises(ValueError):
-        WatchTimeRange(None)  # type: ignore
+        WatchTimeRange(spec)  # type: ignore
 
 
 def test_watchtimerange_default():
@@ -342,74 +273,47 @@ def test_watchtimerange_default():
     assert d.end_time is None
 
 
-def test_watchtimerange_initialized_endless():
-    """Test creating a WatchTimeRange with an endless time range."""
-    d = WatchTimeRange("01:02:03")
-    assert d.start_time == time.fromisoformat("01:02:03")
-    assert d.is_endless
-    assert d.end_time is None
-
-
-def test_watchtimerange_initialized_constrained():
-    """Test creating a WatchTimeRange with a constrained time range."""
-    d = WatchTimeRange("01:02:03-11:11:11")
-    assert d.start_time == time.fromisoformat("01:02:03")
-    assert d.end_time == time.fromisoformat("11:11:11")
-    assert not d.is_endless
-
-
-def test_watchtimerange_initialized_wrong_order():
-    """Test that WatchTimeRange initialization fails with end time before start time."""
-    with raises(ValueError):
-        WatchTimeRange("11:02:03-01:11:11")
-
-
-def test_watchtimerange_check_within():
+@pytest.mark.parametrize(
+    "spec, start, end, endless, repr_",
+    [
+        pytest.param("01:02:03", time(1, 2, 3), None, True, "01:02:03-*", id="endless"),
+        pytest.param(
+            "01:02:03-11:11:11", time(1, 2, 3), time(11, 11, 11), False, "01:02:03-11:11:11", id="constrained"
+        ),
+        pytest.param("05:02:03-11:11:11", time(5, 2, 3), time(11, 11, 11), False, "05:02:03-11:11:11", id="to_string"),
+    ],
+)
+def test_watchtimerange_parse(spec, start, end, endless, repr_):
+    """Test creating a WatchTimeRange from a string and converting it back to a string."""
+    d = WatchTimeRange(spec)
+    assert d.start_time == start
+    assert d.end_time == end
+    assert d.is_endless == endless
+    assert str(d) == repr_
+
+
+@pytest.mark.parametrize(
+    "spec, t, expected",
+    [
+        pytest.param("05:02:03-11:11:11", "07:00:00", True, id="constrained_inside"),
+        pytest.param("05:02:03-11:11:11", "00:15:00", False, id="constrained_outside"),
+        pytest.param("01:02:03", "07:00:00", True, id="endless_inside"),
+        pytest.param("01:02:03", "00:15:00", False, id="endless_outside"),
+    ],
+)
+def test_watchtimerange_check_within(spec, t, expected):
     """Test the is_within function for checking if a time is within a WatchTimeRange."""
-    d = WatchTimeRange("05:02:03-11:11:11")
-    t_inside = time.fromisoformat("07:00:00")
-    assert is_within(d, t_inside)
-
-    t_outside = time.fromisoformat("00:15:00")
-    assert not is_within(d, t_outside)
-
-    endless = WatchTimeRange("01:02:03")
-    assert is_within(endless, t_inside)
-    assert not is_within(endless, t_outside)
+    assert is_within(WatchTimeRange(spec), time.fromisoformat(t)) == expected
 
 
-def test_watchtimerange_to_string():
-    """Test the string representation of a WatchTimeRange object."""
-    d = WatchTimeRange("05:02:03-11:11:11")
-    assert str(d) == "05:02:03-11:11:11"
-
-    endless = WatchTimeRange("01:02:03")
-    assert str(endless) == "01:02:03-*"
-
-
-def test_watch_edit_preserves_other_fields():
+def test_watch_edit_preserves_other_fields(editable_watch):
     """Test that editing a Watch field preserves other field values."""
-    init = (
-        91,
-        92,
-        "zzz",
-        [93],
-        94,
-        95,
-        date.fromisoformat("2027-02-21"),
-        date.fromisoformat("2027-09-17"),
-        "10:30:00-12:00:00",
-        False,
-        None,
-        "Standard",
-    )
-    watch = Watch.from_tuple(init)
+    # Deep copy, so an in-place change to e.g. the specialty list would not show up in both snapshots
+    before = copy.deepcopy({k: v for k, v in vars(editable_watch).items() if k != "city"})
     # Simulate edit
-    new_city = "edited"
-    watch.city = new_city
-    assert watch.city == "edited"
+    editable_watch.city = "edited"
+    after = {k: v for k, v in vars(editable_watch).items() if k != "city"}
+
+    assert editable_watch.city == "edited"
     # Other fields unchanged
-    assert watch.region is not None and watch.region.id == 92
-    assert watch.specialty is not None and watch.specialty[0].id == 93
-    assert watch.clinic is not None and watch.clinic.id == 94
-    assert watch.doctor is not None and watch.doctor.id == 95
+    assert before == after
@@ -7,33 +7,12 @@ and related behaviors in service/database layers.
 import pytest
 from sqlalchemy import text
 
-from src.medicover.watch import Watch, WatchType
-from src.medicover.appointment import Appointment
 from src.id_value_util import IdValue
-from src.medicover.services.watch_service import WatchService
-
-# Reuse SQLite-based testing logic by subclassing to avoid side-effects
-from tests.test_db import SqliteDbLogic, SqliteDbClient  # type: ignore
-
-
-class DummyAPI:
-    async def update_watch_metadata(self, watch):
-        return
-
-
-@pytest.fixture
-def db_logic():
-    return SqliteDbLogic(":memory:")
-
-
-@pytest.fixture
-def db_client():
-    return SqliteDbClient(":memory:")
-
+from src.medicover.appointment import Appointment
+from src.medicover.watch import Watch, WatchType
 
-@pytest.fixture
-def watch_service(db_client):
-    return WatchService(api_client=DummyAPI(), db_client=db_client)  # type: ignore
+_FETCH_APPT = text("SELECT clinic, doctor, specialty, bookingstring, bookingidentifier, account FROM appointment")
+_FETCH_APPT_BY_IDS = text("SELECT bookingidentifier, account FROM appointment WHERE clinic=:c AND doctor=:d")
 
 
 def test_watch_persists_account_alias(db_client):
@@ -91,52 +70,42 @@ def test_watch_service_default_account_on_update(db_client, watch_service):
     assert updated.account == "default"
 
 
-def test_appointment_history_with_account(db_logic):
-    clinic = IdValue(1, "Clinic")
-    doctor = IdValue(2, "Doctor")
-    specialty = IdValue(3, "Spec")
-    ap = Appointment.initialize(
-        clinic=clinic,
-        doctor=doctor,
-        date_time="2025-02-02 10:00:00",
-        specialty=specialty,
-        visit_type="Center",
-        booking_string="bs1",
-        booking_identifier=123,
-        account="accB",
-    )
+@pytest.fixture
+def make_appointment():
+    def _make(clinic_id, doctor_id, specialty_id, date_time, booking_string, booking_identifier=None, account=None):
+        return Appointment.initialize(
+            clinic=IdValue(clinic_id, "Clinic"),
+            doctor=IdValue(doctor_id, "Doctor"),
+            date_time=date_time,
+            specialty=IdValue(specialty_id, "Spec"),
+            visit_type="Center",
+            booking_string=booking_string,
+            booking_identifier=booking_identifier,
+            account=account,
+        )
+
+    return _make
+
+
+def test_appointment_history_with_account(db_logic, make_appointment):
+    ap = make_appointment(1, 2, 3, "2025-02-02 10:00:00", "bs1", 123, "accB")
     db_logic.add_appointment_history(ap)
     with db_logic.get_session() as session:
-        row = session.execute(
-            text("SELECT clinic, doctor, specialty, bookingstring, bookingidentifier, account FROM appointment")
-        ).fetchone()
+        row = session.execute(_FETCH_APPT).fetchone()
         assert row is not None
         assert row[5] == "accB"
 
 
-def test_update_appointment_sets_account(db_logic):
-    clinic = IdValue(10, "Clinic2")
-    doctor = IdValue(20, "Doctor2")
-    specialty = IdValue(30, "Spec2")
+def test_update_appointment_sets_account(db_logic, make_appointment):
     # First add without account
-    ap_initial = Appointment.initialize(
-        clinic=clinic,
-        doctor=doctor,
-        date_time="2025-03-03 11:00:00",
-        specialty=specialty,
-        visit_type="Center",
-        booking_string="bs2",
-        booking_identifier=None,
-    )
+    ap_initial = make_appointment(10, 20, 30, "2025-03-03 11:00:00", "bs2")
     db_logic.add_appointment_history(ap_initial)
     # Now update with booking identifier & account
     ap_initial.booking_identifier = 777
     ap_initial.account = "accC"
     db_logic.update_appointment(ap_initial)
     with db_logic.get_session() as session:
-        row = session.execute(
-            text("SELECT bookingidentifier, account FROM appointment WHERE clinic=10 AND doctor=20")
-        ).fetchone()
+        row = session.execute(_FETCH_APPT_BY_IDS, {"c": 10, "d": 20}).fetchone()
         assert row is not None
         assert str(row[0]) == "777"
         assert row[1] == "accC"
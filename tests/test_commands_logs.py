@@ -5,105 +5,96 @@ This module tests the functionality of the logs command handler, which allows
 users to view recent application logs through the Telegram bot interface.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import NoReturn
+from unittest.mock import MagicMock
 
 import pytest
 
 from src.bot.commands.logs import register_logs_handler
 
 
-@pytest.mark.asyncio
-async def test_handle_logs_no_logs(monkeypatch: pytest.MonkeyPatch) -> None:
-    """
-    Test handling the logs command when no logs are available.
-
-    Verifies that an appropriate message is sent when the log file is empty
-    or doesn't exist.
+def _raise_fail() -> NoReturn:
+    raise Exception("fail")
 
-    Args:
-        monkeypatch: The pytest monkeypatch fixture.
-    """
-    # Arrange
-    dp = MagicMock()
-    # Patch read_n_log_lines_from_file to return empty
-    monkeypatch.setattr("src.bot.commands.logs.read_n_log_lines_from_file", lambda: "")
-    mock_send = AsyncMock()
-    handler = register_logs_handler(dp, send_formatted_reply_override=mock_send)
 
-    message = MagicMock()
-    message.text = "/logs"
+class _AsyncRecorder:
+    """Awaitable stand-in that only records the arguments of each call."""
 
-    # Act
-    await handler(message)
+    def __init__(self):
+        self.calls = []
 
-    # Assert
-    mock_send.assert_awaited_once()
-    args, kwargs = mock_send.call_args
-    assert "❌ No logs found." in args[2], "Should notify that no logs were found"
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
 
 
-@pytest.mark.asyncio
-async def test_handle_logs_with_logs(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture
+def logs_handler(monkeypatch: pytest.MonkeyPatch):
     """
-    Test handling the logs command when logs are available.
-
-    Verifies that log content is properly formatted and sent when logs exist.
+    Register the logs handler with a recording reply function.
 
     Args:
         monkeypatch: The pytest monkeypatch fixture.
-    """
-    # Arrange
-    dp = MagicMock()
-    mock_send = AsyncMock()
-    fake_logs = "line1\nline2\nline3"
 
-    # Patch log reading and formatting functions
-    monkeypatch.setattr("src.bot.commands.logs.read_n_log_lines_from_file", lambda: fake_logs)
+    Returns:
+        A tuple of the handler, the recorded reply function and the incoming message.
+    """
     monkeypatch.setattr("src.bot.commands.logs.format_code_element", lambda x: f"<code>{x}</code>")
+    mock_send = _AsyncRecorder()
+    # register_logs_handler only calls dp.message(...) to register the handler
+    handler = register_logs_handler(MagicMock(spec=["message"]), send_formatted_reply_override=mock_send)
 
-    handler = register_logs_handler(dp, send_formatted_reply_override=mock_send)
+    message = SimpleNamespace(text="/logs", answer=_AsyncRecorder())
 
-    message = MagicMock()
-    message.text = "/logs"
-
-    # Act
-    await handler(message)
-
-    # Assert
-    mock_send.assert_awaited_once()
-    args, kwargs = mock_send.call_args
-    assert "📜 Last 30 lines of logs:" in args[2], "Should include header indicating logs are being shown"
-    assert "<code>line1\nline2\nline3</code>" in args[3], "Should include formatted log content"
+    return handler, mock_send, message
 
 
 @pytest.mark.asyncio
-async def test_handle_logs_exception(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.parametrize(
+    "log_source, expected_title, expected_body, use_message_answer",
+    [
+        pytest.param(lambda: "", "❌ No logs found.", None, False, id="no_logs"),
+        pytest.param(
+            lambda: "line1\nline2\nline3",
+            "📜 Last 30 lines of logs:",
+            "<code>line1\nline2\nline3</code>",
+            False,
+            id="with_logs",
+        ),
+        pytest.param(_raise_fail, "❌ Error while fetching logs.", None, True, id="exception"),
+    ],
+)
+async def test_handle_logs(
+    monkeypatch: pytest.MonkeyPatch, logs_handler, log_source, expected_title, expected_body, use_message_answer
+) -> None:
     """
-    Test handling the logs command when an exception occurs.
+    Test handling the logs command for an empty log, available logs and a failing log read.
 
-    Verifies that an appropriate error message is sent when an exception
-    occurs while trying to fetch logs.
+    Empty or available logs are reported through the reply function, while an exception
+    raised while fetching the logs is answered with an error message directly.
 
     Args:
         monkeypatch: The pytest monkeypatch fixture.
+        logs_handler: The registered handler, the recorded reply function and the message.
+        log_source: Replacement for read_n_log_lines_from_file.
+        expected_title: The expected reply title, or the error answer.
+        expected_body: The expected formatted log content, if any.
+        use_message_answer: Whether the reply is expected via message.answer.
     """
     # Arrange
-    dp = MagicMock()
-    mock_send = AsyncMock()
-
-    # Patch read_n_log_lines_from_file to raise an exception
-    monkeypatch.setattr(
-        "src.bot.commands.logs.read_n_log_lines_from_file", lambda: (_ for _ in ()).throw(Exception("fail"))
-    )
-
-    handler = register_logs_handler(dp, send_formatted_reply_override=mock_send)
-
-    message = MagicMock()
-    message.text = "/logs"
-    message.answer = AsyncMock()  # Patch answer to be awaitable
+    handler, mock_send, message = logs_handler
+    monkeypatch.setattr("src.bot.commands.logs.read_n_log_lines_from_file", log_source)
 
     # Act
     await handler(message)
 
     # Assert
-    message.answer.assert_awaited_once_with("❌ Error while fetching logs.")
+    if use_message_answer:
+        assert message.answer.calls == [((expected_title,), {})]
+        assert not mock_send.calls
+        return
+    assert len(mock_send.calls) == 1
+    args, kwargs = mock_send.calls[0]
+    assert expected_title in args[2], "Should reply with the expected title"
+    if expected_body is not None:
+        assert expected_body in args[3], "Should include formatted log content"
@@ -5,67 +5,47 @@ import pytest
 from src.config import parse_medicover_accounts
 
 
-def test_parse_medicover_accounts_duplicate_alias():
-    """Test that duplicate aliases raise ValueError."""
-    # Same alias used twice
-    userdata = "acc1@dXNlcjE=:cGFzczE=;acc1@dXNlcjI=:cGFzczI="
-    with pytest.raises(ValueError, match="Duplicate alias found: acc1"):
+@pytest.mark.parametrize(
+    "userdata, match",
+    [
+        # Same alias used twice
+        pytest.param("acc1@dXNlcjE=:cGFzczE=;acc1@dXNlcjI=:cGFzczI=", "Duplicate alias found: acc1", id="dup_alias"),
+        # Same username (user1) encoded twice with different aliases
+        pytest.param(
+            "acc1@dXNlcjE=:cGFzczE=;acc2@dXNlcjE=:cGFzczI=", "Duplicate username found: user1", id="dup_username"
+        ),
+    ],
+)
+def test_parse_invalid(userdata, match):
+    """Test that duplicate aliases or usernames raise ValueError."""
+    with pytest.raises(ValueError, match=match):
         parse_medicover_accounts(userdata)
 
 
-def test_parse_medicover_accounts_duplicate_username():
-    """Test that duplicate usernames raise ValueError."""
-    # Same username (user1) encoded twice with different aliases
-    userdata = "acc1@dXNlcjE=:cGFzczE=;acc2@dXNlcjE=:cGFzczI="
-    with pytest.raises(ValueError, match="Duplicate username found: user1"):
-        parse_medicover_accounts(userdata)
-
-
-def test_parse_medicover_accounts_duplicate_username_fallback():
-    """Test that single account fallback processes only first credential, ignoring duplicates."""
-    # Fallback format without @ separator - should only process first entry
-    userdata = "user1:pass1;user1:pass2"
-    accounts, default = parse_medicover_accounts(userdata)
-
-    # Should only have processed the first account
-    assert len(accounts) == 1
-    assert "default" in accounts
-    assert accounts["default"] == ("user1", "pass1")
-    assert default == "default"
-
-
-def test_parse_medicover_accounts_valid_multiple():
-    """Test that valid multiple accounts parse correctly."""
-    # Different aliases and usernames
-    userdata = "acc1@dXNlcjE=:cGFzczE=;acc2@dXNlcjI=:cGFzczI="
-    accounts, default = parse_medicover_accounts(userdata)
-
-    assert len(accounts) == 2
-    assert "acc1" in accounts
-    assert "acc2" in accounts
-    assert accounts["acc1"] == ("user1", "pass1")
-    assert accounts["acc2"] == ("user2", "pass2")
-    assert default == "acc1"
-
-
-def test_parse_medicover_accounts_fallback_ignores_additional():
-    """Test that fallback format only processes first entry and ignores additional ones."""
-    userdata = "user1:pass1;extra_entry;another@entry"
-    accounts, default = parse_medicover_accounts(userdata)
-
-    # Should only process the first fallback entry
-    assert len(accounts) == 1
-    assert "default" in accounts
-    assert accounts["default"] == ("user1", "pass1")
-    assert default == "default"
-
-
-def test_parse_medicover_accounts_single_account_no_duplicates():
-    """Test that single account format doesn't trigger duplicate validation."""
-    userdata = "user1:pass1"
+@pytest.mark.parametrize(
+    "userdata, expected_accounts, expected_default",
+    [
+        # Fallback format without @ separator - should only process first entry
+        pytest.param("user1:pass1;user1:pass2", {"default": ("user1", "pass1")}, "default", id="fallback_dup"),
+        # Different aliases and usernames
+        pytest.param(
+            "acc1@dXNlcjE=:cGFzczE=;acc2@dXNlcjI=:cGFzczI=",
+            {"acc1": ("user1", "pass1"), "acc2": ("user2", "pass2")},
+            "acc1",
+            id="valid_multiple",
+        ),
+        pytest.param(
+            "user1:pass1;extra_entry;another@entry",
+            {"default": ("user1", "pass1")},
+            "default",
+            id="fallback_ignores_additional",
+        ),
+        pytest.param("user1:pass1", {"default": ("user1", "pass1")}, "default", id="single_account"),
+    ],
+)
+def test_parse_valid(userdata, expected_accounts, expected_default):
+    """Test that valid account definitions parse correctly and fallback formats only use the first entry."""
     accounts, default = parse_medicover_accounts(userdata)
 
-    assert len(accounts) == 1
-    assert "default" in accounts
-    assert accounts["default"] == ("user1", "pass1")
-    assert default == "default"
+    assert accounts == expected_accounts
+    assert default == expected_default
@@ -2,36 +2,89 @@
 Test database logic using SQLAlchemy with SQLite for testing.
 """
 
-from typing import Optional
-from sqlalchemy import create_engine
+import sqlite3
+import threading
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
+from src.database import MedicoverDbClient
 from src.database.medicover_db import MedicoverDbLogic
 from src.models import Base
 
 
+def _compile_schema() -> str:
+    dialect = sqlite.dialect()
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table, if_not_exists=True).compile(dialect=dialect)))
+        statements.extend(
+            str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect)) for index in table.indexes
+        )
+    return ";\n".join(statements) + ";"
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # Test databases are throwaway, so skip fsyncs and keep the journal and temp tables in memory
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+# The schema DDL is compiled once and replayed as a script on every new file-backed test database
+_DDL_SQL = _compile_schema()
+
+_schema_template: sqlite3.Connection | None = None
+
+
+def _connect_with_schema() -> sqlite3.Connection:
+    # New in-memory databases are copied from a template holding the schema using sqlite3's backup API,
+    # the template itself is built once per process
+    global _schema_template
+    if _schema_template is None:
+        _schema_template = sqlite3.connect(":memory:", check_same_thread=False)
+        _schema_template.executescript(_DDL_SQL)
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    _schema_template.backup(connection)
+    return connection
+
+
 class SqliteDbLogic(MedicoverDbLogic):
     """Test version of MedicoverDbLogic that uses SQLite instead of PostgreSQL."""
 
     def __init__(self, db_path: str = ":memory:"):
         # Override the parent __init__ to use SQLite instead of calling super().__init__()
-        self._lock = __import__("threading").RLock()
+        self._lock = threading.RLock()
 
         # Create SQLite database URL
         if db_path == ":memory:":
-            database_url = "sqlite:///:memory:"
+            # A single shared connection keeps the in-memory database alive for every session of the engine
+            database_url = "sqlite://"
+            engine_args = {"creator": _connect_with_schema, "poolclass": StaticPool}
         else:
             database_url = f"sqlite:///{db_path}"
+            engine_args = {}
 
         try:
             # Create engine
-            self.engine = create_engine(database_url, echo=False)
+            # A larger statement cache keeps compiled SQL around for the whole session-long engine
+            self.engine = create_engine(database_url, echo=False, query_cache_size=1200, **engine_args)
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
 
             # Create session factory
-            self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+            self.SessionLocal = sessionmaker(
+                autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+            )
 
-            # Create tables
-            Base.metadata.create_all(bind=self.engine)
+            # Create tables, in-memory databases already start with the schema
+            if db_path != ":memory:":
+                with self.engine.begin() as connection:
+                    connection.connection.driver_connection.executescript(_DDL_SQL)
 
             # Don't call clear_db for test databases to avoid timezone issues
 
@@ -39,83 +92,38 @@ class SqliteDbLogic(MedicoverDbLogic):
             raise Exception(f"Failed to connect to test SQLite database: {e}")
 
 
-class SqliteDbClient:
+def flatten_exclusions(exclusions_dict):
+    """Helper function to flatten exclusions dictionary to string format."""
+    if not exclusions_dict:
+        return ""
+
+    return ";".join(
+        f"{key}:{','.join(values) if isinstance(values, list) else values}" for key, values in exclusions_dict.items()
+    )
+
+
+_INSERT_APPOINTMENT_SQL = (
+    "INSERT INTO appointment (clinic, doctor, date, specialty, visittype, bookingstring, bookingidentifier)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def seed_appointments(session, rows):
+    """Insert appointment rows straight through the DBAPI cursor of the session's connection.
+
+    Meant for tests that only read the rows back through the code under test. Going through the
+    session's connection keeps the rows inside the test's transaction, so they are rolled back with it.
+    """
+    cursor = session.connection().connection.driver_connection.cursor()
+    try:
+        cursor.executemany(_INSERT_APPOINTMENT_SQL, rows)
+    finally:
+        cursor.close()
+
+
+class SqliteDbClient(MedicoverDbClient):
     """Test version of DbClient that uses SqliteDbLogic."""
 
-    def __init__(self, db_path: Optional[str] = None):
-        self.db = SqliteDbLogic(db_path or ":memory:")
-
-    def _parse_row_to_watch(self, row):
-        from src.medicover.watch import Watch as MedicoverWatch
-
-        # Convert a database row to a Watch object
-        # Handle the case where multiple specialties are stored as a comma-separated string
-        specialties = [int(w) for w in row[3].split(",")]
-        # Insert specialties into the watch tuple where they belong, between region and clinic
-        watch_tuple = row[:3] + (specialties,) + row[4:]
-        return MedicoverWatch.from_tuple(watch_tuple)
-
-    def get_watch(self, watch_id: int):
-        row = self.db.get_watch(watch_id)
-        if row is None:
-            return None
-        return self._parse_row_to_watch(row)
-
-    def get_watches(self):
-        res = self.db.get_watches()
-        watches = []
-        for watch in res:
-            watches.append(self._parse_row_to_watch(watch))
-        return watches
-
-    def remove_watch(self, watch_id: int) -> bool:
-        return self.db.remove_watch(watch_id)
-
-    def save_watch(self, watch) -> int:
-        return self.db.save_watch(watch)
-
-    def update_appointment(self, appointment):
-        if not self.db.appointment_exists(appointment):
-            self.db.add_appointment_history(appointment)
-        else:
-            self.db.update_appointment(appointment)
-
-    def save_appointments_and_filter_old(self, appointments):
-        new_appointments = []
-        for appointment in appointments:
-            # Check if appointment in the local database
-            if not self.db.appointment_exists(appointment):
-                # If not, append it to the return list and add it to the local database
-                new_appointments.append(appointment)
-                self.db.add_appointment_history(appointment)
-
-        return new_appointments
-
-    def get_booked_appointments(self):
-        from src.medicover.appointment import Appointment as MedicoverAppointment
-
-        appointments = self.db.get_booked_appointments()
-        # Return a list of pairs id-appointment, id is required for cancelling an appointment via the app
-        return [(ap[0], MedicoverAppointment.initialize_from_tuple(ap)) for ap in appointments]
-
-    def update_watch(
-        self,
-        watch_id: int,
-        city: Optional[str] = None,
-        clinic_id: Optional[int] = None,
-        start_date=None,
-        end_date=None,
-        time_range: Optional[str] = None,
-        exclusions: Optional[str] = None,
-        auto_book: Optional[bool] = None,
-    ) -> bool:
-        return self.db.update_watch(
-            watch_id,
-            city,
-            clinic_id,
-            start_date,
-            end_date,
-            time_range,
-            exclusions,
-            auto_book,
-        )
+    def __init__(self, test_db_path: str = ":memory:"):
+        # Override to use SqliteDbLogic instead of DbLogic
+        self.db = SqliteDbLogic(test_db_path)
@@ -0,0 +1,41 @@
+"""Tests for the random appointment generators in tests/utils.py."""
+
+import numpy as np
+import pytest
+
+import tests.utils
+from tests.utils import generate_random_appointment, generate_random_appointments_parallel, shared_appointment_pool
+
+
+def test_cached_appointment_round_robin():
+    """Test that cached appointments cycle through the shared pool in order."""
+    pool = shared_appointment_pool()
+    first = generate_random_appointment(cached=True)
+    start = next(i for i, ap in enumerate(pool) if ap is first)
+
+    drawn = [first] + [generate_random_appointment(cached=True) for _ in range(len(pool))]
+
+    assert all(ap is pool[(start + i) % len(pool)] for i, ap in enumerate(drawn))
+    assert drawn[-1] is first
+
+
+def test_uncached_appointment_is_fresh():
+    """Test that the default path never hands out a pooled instance."""
+    ap = generate_random_appointment()
+    assert all(ap is not pooled for pooled in shared_appointment_pool())
+
+
+@pytest.mark.parametrize("n, workers", [pytest.param(0, 2, id="empty"), pytest.param(101, 4, id="sharded")])
+def test_parallel_generation_length(n, workers):
+    """Test that parallel generation returns exactly n appointments however they are sharded."""
+    assert len(generate_random_appointments_parallel(n, workers=workers)) == n
+
+
+def test_parallel_generation_is_reproducible_with_seed(monkeypatch):
+    """Test that the same seed gives the same appointments, as MEDICONY_TEST_SEED does for the module RNG."""
+
+    def generate():
+        monkeypatch.setattr(tests.utils, "_RNG", np.random.default_rng(seed=1234))
+        return [str(ap) for ap in generate_random_appointments_parallel(20, workers=2)]
+
+    assert generate() == generate()
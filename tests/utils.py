@@ -2,46 +2,119 @@
 Utility functions and classes for MediCony tests.
 """
 
-import random
-from typing import Any, Callable, Dict, List, Optional, Tuple
-from unittest.mock import AsyncMock, MagicMock
+import functools
+import itertools
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
 
-from aiogram import Dispatcher, Router
-from aiogram.fsm.context import FSMContext
+import numpy as np
 
 from src.medicover.appointment import Appointment
 from src.id_value_util import IdValue
 
+# aiogram and unittest.mock are imported where they are used, so modules that only need the
+# data generators (e.g. the presenter tests) don't pay for importing them
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from aiogram import Router
+
+# Set MEDICONY_TEST_SEED to a non-zero integer to make the generated test data reproducible
+_RNG = np.random.default_rng(seed=int(os.environ.get("MEDICONY_TEST_SEED", 0)) or None)
+_SPAWN_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+# Filters returned by setup_watch_service's mock when the test doesn't provide its own; treat as read-only
+_DEFAULT_FILTERS = ({"id": 1, "value": "A"}, {"id": 2, "value": "B"})
+
+
+def spawn_rng() -> np.random.Generator:
+    """Spawn an independent child of the module RNG, deterministic when MEDICONY_TEST_SEED is set."""
+    with _SPAWN_LOCK:
+        return _RNG.spawn(1)[0]
+
+
+def _rng() -> np.random.Generator:
+    # NumPy generators are not thread-safe, so every thread other than the main one draws from its own child stream
+    rng = getattr(_LOCAL, "rng", None)
+    if rng is None:
+        rng = _LOCAL.rng = _RNG if threading.current_thread() is threading.main_thread() else spawn_rng()
+    return rng
+
+
+_APPOINTMENT_POOL_SIZE = 256
+_pool_counter = itertools.count()
+
+
+@functools.cache
+def shared_appointment_pool() -> Tuple[Appointment, ...]:
+    """Random appointments generated once per process and shared by all tests; they must not be modified."""
+    return tuple(generate_random_appointments(_APPOINTMENT_POOL_SIZE))
+
+
+def generate_random_appointment(cached: bool = False) -> Appointment:
+    """
+    Generate a random appointment for testing.
+
+    With cached=True the appointment is taken round-robin from shared_appointment_pool(),
+    for tests that only need a plausible appointment and never modify it.
+    """
+    if not cached:
+        return generate_random_appointments(1)[0]
+    pool = shared_appointment_pool()
+    return pool[next(_pool_counter) % len(pool)]
+
+
+def generate_random_appointments(
+    n: int = int(_RNG.integers(1, 16)), rng: Optional[np.random.Generator] = None
+) -> List[Appointment]:
+    """Generate a list of random appointments for testing, drawing from rng or the calling thread's RNG."""
+    rng = rng if rng is not None else _rng()
+    # Draw every field for all appointments at once, then convert the arrays to plain Python values
+    clinic_ids = rng.integers(1, 1001, size=n).tolist()
+    doctor_ids = rng.integers(1, 1001, size=n).tolist()
+    specialty_ids = rng.integers(1, 1001, size=n).tolist()
+    booking_numbers = rng.integers(1, 1001, size=n).tolist()
+    booking_identifiers = rng.integers(1, 1001, size=n).tolist()
+    years = rng.integers(2023, 2026, size=n).tolist()
+    months = rng.integers(1, 13, size=n).tolist()
+    days = rng.integers(1, 29, size=n).tolist()
+    hours = rng.integers(0, 24, size=n).tolist()
+    minutes = rng.integers(0, 60, size=n).tolist()
+    visit_types = rng.choice(["Center", "Examination"], size=n).tolist()
+
+    date_times = [
+        f"{y:04d}-{mo:02d}-{d:02d} {h:02d}:{mi:02d}:00" for y, mo, d, h, mi in zip(years, months, days, hours, minutes)
+    ]
+    clinics = [IdValue(i, name) for i, name in zip(clinic_ids, map("Clinic {}".format, clinic_ids))]
+    doctors = [IdValue(i, name) for i, name in zip(doctor_ids, map("Doctor {}".format, doctor_ids))]
+    specialties = [IdValue(i, name) for i, name in zip(specialty_ids, map("Specialty {}".format, specialty_ids))]
+    booking_strings = map("BookingString {}".format, booking_numbers)
+    return [
+        Appointment.initialize(clinic, date_time, doctor, specialty, visit_type, booking_string, booking_identifier)
+        for clinic, date_time, doctor, specialty, visit_type, booking_string, booking_identifier in zip(
+            clinics, date_times, doctors, specialties, visit_types, booking_strings, booking_identifiers
+        )
+    ]
+
+
+def _generate_chunk(args: Tuple[np.random.Generator, int]) -> List[Appointment]:
+    rng, n = args
+    return generate_random_appointments(n, rng=rng)
+
 
-def generate_random_appointment() -> Appointment:
-    """Generate a random appointment for testing."""
-    clinic_id = random.randint(1, 1000)
-    clinic_name = f"Clinic {clinic_id}"
-    doctor_id = random.randint(1, 1000)
-    doctor_name = f"Doctor {doctor_id}"
-    specialty_id = random.randint(1, 1000)
-    specialty_name = f"Specialty {specialty_id}"
-    date_time = f"{random.randint(2023, 2025)}-{str(random.randint(1, 12)).zfill(2)}-{str(random.randint(1, 28)).zfill(2)} {str(random.randint(0, 23)).zfill(2)}:{str(random.randint(0, 59)).zfill(2)}:00"
-    visit_type = random.choice(["Center", "Examination"])
-    booking_string = f"BookingString {random.randint(1, 1000)}"
-    booking_identifier = random.randint(1, 1000)
-    return Appointment.initialize(
-        IdValue(clinic_id, clinic_name),
-        date_time,
-        IdValue(doctor_id, doctor_name),
-        IdValue(specialty_id, specialty_name),
-        visit_type,
-        booking_string,
-        booking_identifier,
-    )
-
-
-def generate_random_appointments(n: int = random.randint(1, 15)) -> List[Appointment]:
-    """Generate a list of random appointments for testing."""
-    appointments = []
-    for _ in range(n):
-        appointments.append(generate_random_appointment())
-    return appointments
+def generate_random_appointments_parallel(n: int, workers: Optional[int] = None) -> List[Appointment]:
+    """Generate a large list of random appointments, sharding the work across processes."""
+    workers = min(workers or os.cpu_count() or 1, n) or 1
+    # Every worker draws from its own independent child stream of the module RNG
+    with _SPAWN_LOCK:
+        rngs = _RNG.spawn(workers)
+    sizes = [n // workers + (1 if i < n % workers else 0) for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(itertools.chain.from_iterable(executor.map(_generate_chunk, zip(rngs, sizes))))
 
 
 class DummyMessage:
@@ -49,29 +122,63 @@ class DummyMessage:
 
     def __init__(self, text: Optional[str] = None):
         self.text = text
-        self.answered: List[Tuple[str, Dict[str, Any]]] = []
+        # Reply kwargs (keyboards, parse mode...) are only kept when MEDICONY_CAPTURE_KWARGS=1
+        self.answered: Deque[Tuple[str, Optional[Dict[str, Any]]]] = deque()
+        self._capture_kwargs = os.environ.get("MEDICONY_CAPTURE_KWARGS") == "1"
 
     async def answer(self, text: str, **kwargs: Any) -> str:
         """Simulate responding to a message."""
-        self.answered.append((text, kwargs))
+        self.answered.append((text, kwargs if self._capture_kwargs else None))
         return text
 
 
-def create_mock_fsm_context(initial_data: Optional[Dict[str, Any]] = None) -> MagicMock:
-    """Create a mock FSMContext for testing state machine handlers."""
-    state = MagicMock(spec=FSMContext)
-    state.get_data = AsyncMock(return_value=initial_data or {})
-    state.update_data = AsyncMock()
-    state.set_state = AsyncMock()
-    state.clear = AsyncMock()
+class _FakeFSM:
+    """Minimal in-memory stand-in for FSMContext, implementing only the methods the handlers call."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._state: Any = None
+
+    async def get_data(self) -> Dict[str, Any]:
+        return self._data.copy()
+
+    async def update_data(self, data: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Dict[str, Any]:
+        if data:
+            self._data.update(data)
+        self._data.update(kwargs)
+        return self._data.copy()
+
+    async def set_state(self, state: Any = None) -> None:
+        self._state = state
+
+    async def clear(self) -> None:
+        self._state = None
+        self._data.clear()
+
+
+def create_mock_fsm_context(initial_data: Optional[Dict[str, Any]] = None, track: bool = False) -> _FakeFSM:
+    """
+    Create a fake FSMContext for testing state machine handlers.
+
+    With track=True every method is wrapped in an AsyncMock, so tests can assert on the calls.
+    """
+    state = _FakeFSM(dict(initial_data or {}))
+    if track:
+        from unittest.mock import AsyncMock
+
+        for name in ("get_data", "update_data", "set_state", "clear"):
+            setattr(state, name, AsyncMock(wraps=getattr(state, name)))
     return state
 
 
 def setup_command_handler(
-    handler_register_func: Callable, watch_service: Optional[MagicMock] = None, **kwargs: Any
-) -> Tuple[MagicMock, Router]:
+    handler_register_func: Callable, watch_service: Optional["MagicMock"] = None, **kwargs: Any
+) -> Tuple["MagicMock", "Router"]:
     """Set up a command handler with dispatcher and router for testing."""
-    dp = MagicMock(spec=Dispatcher)
+    from unittest.mock import MagicMock
+
+    # A plain MagicMock is enough for the handlers; spec=Dispatcher made every call introspect aiogram's Dispatcher
+    dp = MagicMock()
     dp.sub_routers = []
 
     if watch_service is None:
@@ -87,16 +194,15 @@ def setup_command_handler(
 
 def setup_watch_service(
     available_filters: Optional[List[Dict[str, Any]]] = None, watches: Optional[List[Any]] = None
-) -> MagicMock:
+) -> "MagicMock":
     """Create a mock watch service for testing."""
+    from unittest.mock import AsyncMock, MagicMock
+
     watch_service = MagicMock()
 
-    if available_filters is not None:
-        watch_service.list_available_filters = AsyncMock(return_value=available_filters)
-    else:
-        watch_service.list_available_filters = AsyncMock(
-            side_effect=lambda what, **kwargs: [{"id": 1, "value": "A"}, {"id": 2, "value": "B"}]
-        )
+    if available_filters is None:
+        available_filters = list(_DEFAULT_FILTERS)
+    watch_service.list_available_filters = AsyncMock(return_value=available_filters)
 
     if watches is not None:
         watch_service.get_all_watches = AsyncMock(return_value=watches)
@@ -108,12 +214,15 @@ def setup_watch_service(
 
 
 async def process_conversation(
-    router: Router, handlers_path: List[int], messages: List[str], state: MagicMock
-) -> List[DummyMessage]:
-    """Process a conversation through multiple handlers."""
+    router: "Router", handlers_path: List[int], messages: List[str], state: Any
+) -> List[List[Tuple[str, Optional[Dict[str, Any]]]]]:
+    """Process a conversation through multiple handlers, returning the replies given at each step."""
+    # A single message object is reused for the whole conversation; each step's replies are sliced off its tail
+    msg = DummyMessage()
     responses = []
-    for i, message_text in enumerate(messages):
-        msg = DummyMessage(message_text)
-        await router.message.handlers[handlers_path[i]].callback(msg, state)
-        responses.append(msg)
+    for handler_idx, message_text in zip(handlers_path, messages):
+        msg.text = message_text
+        before = len(msg.answered)
+        await router.message.handlers[handler_idx].callback(msg, state)
+        responses.append(list(itertools.islice(msg.answered, before, None)))
     return responses